@@ -6,6 +6,11 @@ from .models import Category, Comment, Location, Post
 class PostInLine(admin.TabularInline):
     model = Post
     extra = 0
+    raw_id_fields = (
+        'author',
+        'location',
+        'category',
+    )
 
 
 class CategoryAdmin(admin.ModelAdmin):
@@ -28,6 +33,7 @@ class CommentAdmin(admin.ModelAdmin):
     )
     list_editable = ('is_published',)
     list_filter = ('is_published',)
+    list_select_related = ('author',)
 
 
 class LocationAdmin(admin.ModelAdmin):
@@ -57,6 +63,11 @@ class PostAdmin(admin.ModelAdmin):
     search_fields = ('title',)
     list_filter = ('is_published',)
     list_display_links = ('title',)
+    list_select_related = (
+        'author',
+        'location',
+        'category',
+    )
 
 
 admin.site.register(Category, CategoryAdmin)
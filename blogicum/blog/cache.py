@@ -0,0 +1,105 @@
+import hashlib
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.middleware.cache import CacheMiddleware
+from django.utils.decorators import decorator_from_middleware_with_args
+
+from .models import Post
+
+POSTS_VERSION_KEY: str = 'posts_version'
+POSTS_STATS_TIMEOUT: int = 60
+
+_page_key_prefix: ContextVar = ContextVar('posts_page_key_prefix')
+
+
+def get_posts_version() -> int:
+    """Текущая версия данных о постах для ключей кеша."""
+    return cache.get_or_set(
+        POSTS_VERSION_KEY,
+        lambda: int(time.time()),
+        timeout=None,
+    )
+
+
+def bump_posts_version() -> None:
+    """Инвалидирует всё, что закешировано по версии постов."""
+    try:
+        cache.incr(POSTS_VERSION_KEY)
+    except ValueError:
+        cache.set(POSTS_VERSION_KEY, int(time.time()), timeout=None)
+
+
+class PostsCacheMiddleware(CacheMiddleware):
+    """
+    CacheMiddleware, у которого префикс ключа берётся из версии постов,
+    поэтому любое изменение постов, комментариев или категорий
+    делает кеш неактуальным.
+    Версия читается один раз при получении запроса и сохраняется в нём:
+    ответ кладётся в кеш под той же версией, даже если данные
+    изменились, пока страница рендерилась.
+    """
+
+    @property
+    def key_prefix(self) -> str:
+        return _page_key_prefix.get()
+
+    @key_prefix.setter
+    def key_prefix(self, value: str) -> None:
+        """Префикс задаётся версией постов, переданное значение не нужно."""
+
+    @contextmanager
+    def _request_key_prefix(self, request):
+        if not hasattr(request, '_posts_cache_prefix'):
+            request._posts_cache_prefix = (
+                f'posts_page:{get_posts_version()}'
+            )
+        token = _page_key_prefix.set(request._posts_cache_prefix)
+        try:
+            yield
+        finally:
+            _page_key_prefix.reset(token)
+
+    def process_request(self, request):
+        with self._request_key_prefix(request):
+            return super().process_request(request)
+
+    def process_response(self, request, response):
+        with self._request_key_prefix(request):
+            return super().process_response(request, response)
+
+
+def cache_posts_page(timeout: int):
+    """Кеширует страницу со списком постов до изменения данных о постах."""
+    return decorator_from_middleware_with_args(PostsCacheMiddleware)(
+        page_timeout=timeout,
+    )
+
+
+def posts_list_etag(request, category_slug=None, **kwargs) -> str:
+    """
+    ETag страницы со списком постов.
+    Строится по версии постов, дате последней публикации и числу постов,
+    поэтому учитывает и отложенные публикации, ставшие видимыми.
+    Агрегаты кешируются, чтобы попадание в кеш страницы обходилось
+    без запросов к БД.
+    """
+    key = f'posts_stats:{category_slug}:{get_posts_version()}'
+    stats = cache.get(key)
+    if stats is None:
+        posts = Post.published.select_related(None)
+        if category_slug is not None:
+            posts = posts.filter(category__slug=category_slug)
+        stats = posts.aggregate(last=Max('pub_date'), total=Count('pk'))
+        cache.set(key, stats, POSTS_STATS_TIMEOUT)
+    raw = ':'.join(map(str, (
+        get_posts_version(),
+        stats['last'],
+        stats['total'],
+        request.user.pk,
+        request.GET.urlencode(),
+    )))
+    return hashlib.md5(raw.encode()).hexdigest()
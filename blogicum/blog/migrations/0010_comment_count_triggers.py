@@ -0,0 +1,82 @@
+# Keeps Post.comment_count in sync with database triggers on blog_comment.
+# Supported backends: SQLite, PostgreSQL, MySQL. Wherever the triggers are
+# missing, blog.signals updates the counter with F() instead.
+
+from django.db import migrations
+
+INSERT_SQL = (
+    'UPDATE blog_post SET comment_count = comment_count + 1 '
+    'WHERE id = NEW.post_id;'
+)
+DELETE_SQL = (
+    'UPDATE blog_post SET comment_count = comment_count - 1 '
+    'WHERE id = OLD.post_id;'
+)
+
+FORWARD_SQL = {
+    'sqlite': (
+        'CREATE TRIGGER blog_comment_count_insert '
+        'AFTER INSERT ON blog_comment '
+        f'BEGIN {INSERT_SQL} END;',
+        'CREATE TRIGGER blog_comment_count_delete '
+        'AFTER DELETE ON blog_comment '
+        f'BEGIN {DELETE_SQL} END;',
+    ),
+    'postgresql': (
+        'CREATE FUNCTION blog_comment_count_insert() RETURNS trigger AS $$ '
+        f'BEGIN {INSERT_SQL} RETURN NULL; END; $$ LANGUAGE plpgsql;',
+        'CREATE FUNCTION blog_comment_count_delete() RETURNS trigger AS $$ '
+        f'BEGIN {DELETE_SQL} RETURN NULL; END; $$ LANGUAGE plpgsql;',
+        'CREATE TRIGGER blog_comment_count_insert '
+        'AFTER INSERT ON blog_comment FOR EACH ROW '
+        'EXECUTE PROCEDURE blog_comment_count_insert();',
+        'CREATE TRIGGER blog_comment_count_delete '
+        'AFTER DELETE ON blog_comment FOR EACH ROW '
+        'EXECUTE PROCEDURE blog_comment_count_delete();',
+    ),
+    'mysql': (
+        'CREATE TRIGGER blog_comment_count_insert '
+        f'AFTER INSERT ON blog_comment FOR EACH ROW {INSERT_SQL}',
+        'CREATE TRIGGER blog_comment_count_delete '
+        f'AFTER DELETE ON blog_comment FOR EACH ROW {DELETE_SQL}',
+    ),
+}
+
+BACKWARD_SQL = {
+    'sqlite': (
+        'DROP TRIGGER IF EXISTS blog_comment_count_insert;',
+        'DROP TRIGGER IF EXISTS blog_comment_count_delete;',
+    ),
+    'postgresql': (
+        'DROP TRIGGER IF EXISTS blog_comment_count_insert ON blog_comment;',
+        'DROP TRIGGER IF EXISTS blog_comment_count_delete ON blog_comment;',
+        'DROP FUNCTION IF EXISTS blog_comment_count_insert();',
+        'DROP FUNCTION IF EXISTS blog_comment_count_delete();',
+    ),
+    'mysql': (
+        'DROP TRIGGER IF EXISTS blog_comment_count_insert;',
+        'DROP TRIGGER IF EXISTS blog_comment_count_delete;',
+    ),
+}
+
+
+def run_vendor_sql(statements):
+    def run(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        for sql in statements.get(vendor, ()):
+            schema_editor.execute(sql, params=None)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_vendor_sql(FORWARD_SQL),
+            run_vendor_sql(BACKWARD_SQL),
+        ),
+    ]
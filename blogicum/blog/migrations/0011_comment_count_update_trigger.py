@@ -0,0 +1,67 @@
+# Moves comment_count between posts when blog_comment.post_id changes.
+# Supported backends match 0010_comment_count_triggers.
+
+from django.db import migrations
+
+MOVE_SQL = (
+    'UPDATE blog_post SET comment_count = comment_count + '
+    'CASE WHEN id = NEW.post_id THEN 1 ELSE -1 END '
+    'WHERE id IN (OLD.post_id, NEW.post_id)'
+)
+
+FORWARD_SQL = {
+    'sqlite': (
+        'CREATE TRIGGER blog_comment_count_update '
+        'AFTER UPDATE OF post_id ON blog_comment '
+        'WHEN OLD.post_id <> NEW.post_id '
+        f'BEGIN {MOVE_SQL}; END;',
+    ),
+    'postgresql': (
+        'CREATE FUNCTION blog_comment_count_update() RETURNS trigger AS $$ '
+        f'BEGIN {MOVE_SQL}; RETURN NULL; END; $$ LANGUAGE plpgsql;',
+        'CREATE TRIGGER blog_comment_count_update '
+        'AFTER UPDATE OF post_id ON blog_comment FOR EACH ROW '
+        'WHEN (OLD.post_id IS DISTINCT FROM NEW.post_id) '
+        'EXECUTE PROCEDURE blog_comment_count_update();',
+    ),
+    'mysql': (
+        'CREATE TRIGGER blog_comment_count_update '
+        'AFTER UPDATE ON blog_comment FOR EACH ROW '
+        f'{MOVE_SQL} AND OLD.post_id <> NEW.post_id;',
+    ),
+}
+
+BACKWARD_SQL = {
+    'sqlite': (
+        'DROP TRIGGER IF EXISTS blog_comment_count_update;',
+    ),
+    'postgresql': (
+        'DROP TRIGGER IF EXISTS blog_comment_count_update ON blog_comment;',
+        'DROP FUNCTION IF EXISTS blog_comment_count_update();',
+    ),
+    'mysql': (
+        'DROP TRIGGER IF EXISTS blog_comment_count_update;',
+    ),
+}
+
+
+def run_vendor_sql(statements):
+    def run(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        for sql in statements.get(vendor, ()):
+            schema_editor.execute(sql, params=None)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_comment_count_triggers'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_vendor_sql(FORWARD_SQL),
+            run_vendor_sql(BACKWARD_SQL),
+        ),
+    ]
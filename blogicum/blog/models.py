@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models.functions import Now
 from django.urls import reverse
 
 User = get_user_model()
@@ -65,6 +66,26 @@ class Category(PublishedModel):
         return f'"{self.title[:25]}" - {self.description[:50]}...'
 
 
+class PublishedPostManager(models.Manager):
+    """
+    Менеджер опубликованных постов:
+    - пост разрешён к публикации;
+    - категория разрешена к публикации;
+    - время публикации уже наступило.
+    """
+
+    def get_queryset(self) -> models.QuerySet:
+        return super().get_queryset().select_related(
+            'author',
+            'location',
+            'category',
+        ).filter(
+            pub_date__lte=Now(),
+            is_published=True,
+            category__is_published=True,
+        )
+
+
 class Post(PublishedModel):
     """Модель публикации."""
     title = models.CharField(
@@ -107,11 +128,51 @@ class Post(PublishedModel):
         verbose_name='Категория',
         related_name='posts',
     )
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев',
+    )
+
+    objects = models.Manager()
+    published = PublishedPostManager()
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ('-pub_date', 'title',)
+        indexes = (
+            models.Index(
+                fields=('-pub_date', '-id'),
+                name='post_pub_date_id_idx',
+            ),
+            models.Index(
+                fields=('-pub_date', '-id'),
+                condition=models.Q(is_published=True),
+                name='post_pub_live_idx',
+            ),
+            models.Index(
+                fields=('category', '-pub_date', '-id'),
+                name='post_category_pub_date_idx',
+            ),
+        )
+
+    def save(self, *args, **kwargs) -> None:
+        """
+        Обновление существующего поста не перезаписывает comment_count:
+        счётчик ведут триггеры БД, а в объекте он может быть устаревшим.
+        """
+        if (
+            not self._state.adding
+            and self.pk is not None
+            and kwargs.get('update_fields') is None
+            and not kwargs.get('force_insert')
+        ):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'comment_count'
+            ]
+        super().save(*args, **kwargs)
 
     def get_absolute_url(self) -> str:
         return reverse('blog:post_detail', kwargs={'pk': self.pk})
@@ -0,0 +1,44 @@
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.utils.functional import cached_property
+
+from .cache import get_posts_version
+
+POSTS_COUNT_TIMEOUT: int = 60
+
+
+class PostPaginator(Paginator):
+    """
+    Пагинатор для списков постов.
+    Кеширует количество объектов по ключу от представления и версии постов.
+    Страницу выбирает в два запроса: сначала узкий срез первичных ключей
+    по индексу, затем полные строки только для этих ключей.
+    """
+
+    def __init__(self, *args, cache_key: str, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.cache_key = cache_key
+
+    @cached_property
+    def count(self) -> int:
+        key = f'posts_count:{self.cache_key}:{get_posts_version()}'
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, POSTS_COUNT_TIMEOUT)
+        return count
+
+    def page(self, number) -> Page:
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        page_pks = list(
+            self.object_list.values_list('pk', flat=True)[bottom:top]
+        )
+        return self._get_page(
+            self.object_list.filter(pk__in=page_pks),
+            number,
+            self,
+        )
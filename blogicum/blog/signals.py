@@ -0,0 +1,148 @@
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.db.models import F
+from django.db.models.signals import (
+    post_delete, post_migrate, post_save, pre_save
+)
+from django.dispatch import receiver
+
+from .cache import bump_posts_version
+from .models import Category, Comment, Location, Post, User
+
+# Триггеры из миграций 0010 и 0011, которые ведут comment_count.
+COMMENT_COUNT_TRIGGERS: dict = {
+    'insert': 'blog_comment_count_insert',
+    'update': 'blog_comment_count_update',
+    'delete': 'blog_comment_count_delete',
+}
+TRIGGER_NAMES_SQL: dict = {
+    'sqlite': (
+        "SELECT name FROM sqlite_master "
+        "WHERE type = 'trigger' AND tbl_name = 'blog_comment'"
+    ),
+    'postgresql': (
+        "SELECT tgname FROM pg_trigger "
+        "WHERE tgrelid = 'blog_comment'::regclass AND NOT tgisinternal"
+    ),
+    'mysql': (
+        "SELECT trigger_name FROM information_schema.triggers "
+        "WHERE event_object_schema = DATABASE() "
+        "AND event_object_table = 'blog_comment'"
+    ),
+}
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+def invalidate_posts_cache(**kwargs) -> None:
+    """Сбрасывает кеш списков постов при изменении отображаемых данных."""
+    bump_posts_version()
+
+
+@receiver(pre_save, sender=User)
+def remember_username_change(
+    sender, instance, update_fields=None, **kwargs
+) -> None:
+    """
+    Отмечает смену имени пользователя — единственного поля автора,
+    которое выводится в карточках постов. Сохранение last_login при
+    входе на сайт кеш не сбрасывает.
+    """
+    if instance.pk is None or (
+        update_fields is not None and 'username' not in update_fields
+    ):
+        return
+    previous_username = sender.objects.filter(
+        pk=instance.pk
+    ).values_list('username', flat=True).first()
+    instance._username_changed = previous_username not in (
+        None, instance.username
+    )
+
+
+@receiver(post_save, sender=User)
+def invalidate_posts_cache_on_rename(instance, **kwargs) -> None:
+    """Сбрасывает кеш списков постов после смены имени пользователя."""
+    if getattr(instance, '_username_changed', False):
+        instance._username_changed = False
+        bump_posts_version()
+
+
+def get_comment_count_triggers(using: str) -> frozenset:
+    """Имена триггеров blog_comment, которые реально есть в БД."""
+    connection = connections[using]
+    triggers = getattr(connection, '_comment_count_triggers', None)
+    if triggers is None:
+        names = set()
+        sql = TRIGGER_NAMES_SQL.get(connection.vendor)
+        if sql is not None:
+            with connection.cursor() as cursor:
+                cursor.execute(sql)
+                names = {row[0] for row in cursor.fetchall()}
+        triggers = connection._comment_count_triggers = frozenset(names)
+    return triggers
+
+
+def reset_comment_count_triggers(using: str) -> None:
+    """Сбрасывает закешированный на соединении список триггеров."""
+    connections[using].__dict__.pop('_comment_count_triggers', None)
+
+
+def has_comment_count_trigger(action: str, using: str) -> bool:
+    """Проверяет, что триггер comment_count для действия есть в БД."""
+    return COMMENT_COUNT_TRIGGERS[action] in get_comment_count_triggers(using)
+
+
+def change_comment_count(post_id: int, delta: int, using: str) -> None:
+    """Изменяет comment_count поста на delta без загрузки поста."""
+    Post.objects.using(using).filter(pk=post_id).update(
+        comment_count=F('comment_count') + delta
+    )
+
+
+@receiver(pre_save, sender=Comment)
+def remember_comment_post(sender, instance, using, **kwargs) -> None:
+    """Запоминает прежний пост комментария, если нет триггера переноса."""
+    if has_comment_count_trigger('update', using) or instance.pk is None:
+        return
+    instance._previous_post_id = sender.objects.using(using).filter(
+        pk=instance.pk
+    ).values_list('post_id', flat=True).first()
+
+
+@receiver(post_save, sender=Comment)
+def count_saved_comment(instance, created, using, **kwargs) -> None:
+    """Обновляет comment_count при создании и переносе комментария."""
+    if created:
+        if not has_comment_count_trigger('insert', using):
+            change_comment_count(instance.post_id, 1, using)
+        return
+    previous_post_id = getattr(instance, '_previous_post_id', None)
+    if previous_post_id not in (None, instance.post_id):
+        change_comment_count(previous_post_id, -1, using)
+        change_comment_count(instance.post_id, 1, using)
+
+
+@receiver(post_delete, sender=Comment)
+def count_deleted_comment(instance, using, **kwargs) -> None:
+    """Обновляет comment_count при удалении комментария."""
+    if not has_comment_count_trigger('delete', using):
+        change_comment_count(instance.post_id, -1, using)
+
+
+@receiver(connection_created)
+def forget_triggers_on_connect(connection, **kwargs) -> None:
+    """Новое соединение заново проверяет наличие триггеров."""
+    reset_comment_count_triggers(connection.alias)
+
+
+@receiver(post_migrate)
+def forget_triggers_on_migrate(using, **kwargs) -> None:
+    """Миграции могли пересоздать таблицу комментариев вместе с триггерами."""
+    reset_comment_count_triggers(using)
@@ -1,14 +1,29 @@
 from django.urls import path
+from django.views.decorators.http import etag
+from django.views.decorators.vary import vary_on_cookie
 
 from . import views
+from .cache import cache_posts_page, posts_list_etag
 
 app_name: str = 'blog'
 
 urlpatterns: list = [
-    path('', views.PostListView.as_view(), name='index'),
+    path(
+        '',
+        etag(posts_list_etag)(
+            cache_posts_page(60)(
+                vary_on_cookie(views.PostListView.as_view())
+            )
+        ),
+        name='index',
+    ),
     path(
         'category/<slug:category_slug>/',
-        views.CategoryListView.as_view(),
+        etag(posts_list_etag)(
+            cache_posts_page(30)(
+                vary_on_cookie(views.CategoryListView.as_view())
+            )
+        ),
         name='category_posts',
     ),
 ]
@@ -1,7 +1,7 @@
 from typing import Any, Dict
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Count
+from django.db.models import Prefetch
 from django.db.models.query import QuerySet
 from django.http import Http404
 from django.http.response import HttpResponse
@@ -14,33 +14,39 @@ from django.views.generic import (
 
 from .forms import CommentForm, PostForm
 from .models import Category, Comment, Post, User
+from .paginators import PostPaginator
 
 PAGINATE_COUNT: int = 10
-
-
-def get_general_posts_filter() -> QuerySet[Any]:
-    """Фильтр для постов со счётчиком комментариев и сортировкой."""
-    return Post.objects.select_related(
-        'author',
-        'location',
-        'category',
-    ).filter(
-        pub_date__lte=timezone.now(),
-        is_published=True,
-        category__is_published=True,
-    ).annotate(
-        comment_count=Count('comments')
-    ).order_by('-pub_date')
+POST_CARD_FIELDS: tuple = (
+    'title',
+    'text',
+    'image',
+    'pub_date',
+    'is_published',
+    'comment_count',
+    'author__username',
+    'location__name',
+    'location__is_published',
+    'category__title',
+    'category__slug',
+    'category__is_published',
+)
 
 
 class EditContentMixin(LoginRequiredMixin):
     """
     Добавляет проверку авторства для редактирования и удаления.
     Если проверка провалена, то возвращает на страницу поста.
+    Объект кешируется на время запроса.
     """
 
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_object'):
+            self._object = super().get_object(queryset)
+        return self._object
+
     def dispatch(self, request, *args, **kwargs) -> HttpResponse:
-        if self.get_object().author != request.user:
+        if self.get_object().author_id != request.user.id:
             return redirect(
                 'blog:post_detail',
                 post_id=self.kwargs['post_id']
@@ -90,8 +96,19 @@ class PostFormMixin(PostMixin):
 
 
 class PostListMixin(PostMixin):
-    """Миксин для страниц со списком постов и пагинацией."""
+    """
+    Миксин для страниц со списком постов и пагинацией.
+    Количество постов кешируется отдельно для каждой страницы и её фильтра.
+    """
     paginate_by = PAGINATE_COUNT
+    paginator_class = PostPaginator
+
+    def get_paginator(self, *args, **kwargs) -> PostPaginator:
+        kwargs['cache_key'] = ':'.join(
+            [type(self).__name__]
+            + [f'{key}={value}' for key, value in sorted(self.kwargs.items())]
+        )
+        return super().get_paginator(*args, **kwargs)
 
 
 class PostCreateMixin:
@@ -109,7 +126,9 @@ class PostListView(PostListMixin, ListView):
     template_name = 'blog/index.html'
 
     def get_queryset(self) -> QuerySet[Any]:
-        return get_general_posts_filter()
+        return Post.published.only(
+            *POST_CARD_FIELDS
+        ).order_by('-pub_date', '-id')
 
 
 class PostDetailView(PostMixin, DetailView):
@@ -117,27 +136,23 @@ class PostDetailView(PostMixin, DetailView):
     template_name = 'blog/detail.html'
     pk_url_kwarg = 'post_id'
 
-    # def dispatch(self, request, *args, **kwargs) -> HttpResponse:
-    #     """
-    #     Условия фильтрации, если пользователь не является автором поста:
-    #     - пост разрешён к публикации;
-    #     - категория разрешена к публикации;
-    #     - текущее время больше времени публикации.
-    #     """
-    #     self.object = self.get_object()
-    #     if self.object.author != self.request.user and (
-    #         self.object.is_published is False
-    #         or self.object.category.is_published is False
-    #         or self.object.pub_date > timezone.now()
-    #     ):
-    #         raise Http404
-    #     return super().dispatch(request, *args, **kwargs)
-
     def get_queryset(self) -> QuerySet[Any]:
         return super().get_queryset().select_related(
             'author',
             'location',
             'category',
+        ).defer(
+            'category__description',
+        ).prefetch_related(
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.select_related('author').only(
+                    'post',
+                    'text',
+                    'created_at',
+                    'author__username',
+                ),
+            ),
         )
 
     def get_object(self, queryset=None):
@@ -146,22 +161,23 @@ class PostDetailView(PostMixin, DetailView):
         - пост разрешён к публикации;
         - категория разрешена к публикации;
         - текущее время больше времени публикации.
+        Объект кешируется на время запроса.
         """
-        post = super().get_object(queryset)
-        if post.author != self.request.user and (
-            post.is_published is False
-            or post.category.is_published is False
-            or post.pub_date > timezone.now()
-        ):
-            raise Http404
-        return post
+        if not hasattr(self, '_post'):
+            post = super().get_object(queryset)
+            if post.author_id != self.request.user.id and (
+                not post.is_published
+                or not post.category.is_published
+                or post.pub_date > timezone.now()
+            ):
+                raise Http404
+            self._post = post
+        return self._post
 
     def get_context_data(self, **kwargs) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = self.object.comments.select_related(
-            'author'
-        )
+        context['comments'] = self.object.comments.all()
         return context
 
 
@@ -170,17 +186,20 @@ class CategoryListView(PostListMixin, ListView):
     template_name = 'blog/category.html'
 
     def get_queryset(self) -> QuerySet[Any]:
-        return get_general_posts_filter().filter(
-            category__slug=self.kwargs['category_slug'],
-        )
-
-    def get_context_data(self, **kwargs) -> Dict[str, Any]:
-        context = super().get_context_data(**kwargs)
-        context['category'] = get_object_or_404(
+        self.category = get_object_or_404(
             Category,
             is_published=True,
             slug=self.kwargs['category_slug'],
         )
+        return Post.published.filter(
+            category=self.category,
+        ).only(
+            *POST_CARD_FIELDS
+        ).order_by('-pub_date', '-id')
+
+    def get_context_data(self, **kwargs) -> Dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context['category'] = self.category
         return context
 
 
@@ -238,9 +257,9 @@ class ProfilePostListView(PostListMixin, ListView):
             'category',
         ).filter(
             author=self.author
-        ).annotate(
-            comment_count=Count('comments')
-        ).order_by('-pub_date')
+        ).only(
+            *POST_CARD_FIELDS
+        ).order_by('-pub_date', '-id')
 
     def get_context_data(self, **kwargs) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
@@ -284,10 +303,10 @@ class CommentCreateView(LoginRequiredMixin, CommentFormMixin, CreateView):
 
     def form_valid(self, form):
         form.instance.author = self.request.user
-        form.instance.post = get_object_or_404(
-            get_general_posts_filter(),
+        form.instance.post_id = get_object_or_404(
+            Post.published.select_related(None).only('id'),
             pk=self.kwargs['post_id']
-        )
+        ).id
         return super().form_valid(form)
 
 
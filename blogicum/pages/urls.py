@@ -1,10 +1,26 @@
 from django.urls import path
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 
 from . import views
 
 app_name: str = 'pages'
 
+STATIC_PAGE_TIMEOUT: int = 60 * 60
+
 urlpatterns: list = [
-    path('about/', views.AboutView.as_view(), name='about'),
-    path('rules/', views.RulesView.as_view(), name='rules'),
+    path(
+        'about/',
+        cache_page(STATIC_PAGE_TIMEOUT)(
+            vary_on_cookie(views.AboutView.as_view())
+        ),
+        name='about',
+    ),
+    path(
+        'rules/',
+        cache_page(STATIC_PAGE_TIMEOUT)(
+            vary_on_cookie(views.RulesView.as_view())
+        ),
+        name='rules',
+    ),
 ]
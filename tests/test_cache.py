@@ -0,0 +1,147 @@
+import pytest
+from django.db.models import Model
+from django.http import HttpResponse
+from django.test import Client
+from mixer.backend.django import Mixer
+
+from blog.cache import (
+    bump_posts_version,
+    cache_posts_page,
+    get_posts_version,
+)
+
+
+def is_cached(response) -> bool:
+    return response.context is None
+
+
+@pytest.mark.django_db
+def test_index_page_is_cached(client: Client, post_with_published_location):
+    assert not is_cached(client.get("/"))
+    assert is_cached(client.get("/"))
+
+
+@pytest.mark.django_db
+def test_login_keeps_posts_cache(user: Model, client: Client):
+    version = get_posts_version()
+    client.force_login(user)
+    assert get_posts_version() == version
+
+
+@pytest.mark.django_db
+def test_username_change_invalidates_posts_cache(
+    user: Model, user_client: Client, post_with_published_location
+):
+    user_client.get("/")
+    user.username = f"{user.username}_renamed"
+    user.save()
+    response = user_client.get("/")
+    assert not is_cached(response)
+    assert user.username in response.content.decode("utf-8")
+
+
+@pytest.mark.django_db
+def test_warm_list_pages_skip_database(
+    client: Client, post_with_published_location, django_assert_num_queries
+):
+    category_url = (
+        f"/category/{post_with_published_location.category.slug}/"
+    )
+    for url in ("/", category_url):
+        client.get(url)
+        with django_assert_num_queries(0):
+            response = client.get(url)
+        etag = response["ETag"]
+        with django_assert_num_queries(0):
+            response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_new_comment_and_comment_edit_invalidate_list_pages(
+    user_client: Client, post_with_published_location
+):
+    post = post_with_published_location
+    user_client.get("/")
+    user_client.post(f"/posts/{post.id}/comment/", {"text": "first"})
+    response = user_client.get("/")
+    assert not is_cached(response)
+    assert "(1)" in response.content.decode("utf-8")
+
+    comment = post.comments.get()
+    user_client.post(
+        f"/posts/{post.id}/edit_comment/{comment.id}/", {"text": "edited"}
+    )
+    assert not is_cached(user_client.get("/"))
+
+
+@pytest.mark.django_db
+def test_new_post_invalidates_list_pages(
+    mixer: Mixer, client: Client, post_with_published_location
+):
+    category_url = (
+        f"/category/{post_with_published_location.category.slug}/"
+    )
+    for url in ("/", category_url):
+        client.get(url)
+    new_post = mixer.blend(
+        "blog.Post", category=post_with_published_location.category
+    )
+    for url in ("/", category_url):
+        response = client.get(url)
+        assert not is_cached(response)
+        assert new_post in response.context["page_obj"]
+
+
+@pytest.mark.django_db
+def test_detail_page_queries(
+    mixer: Mixer,
+    client: Client,
+    post_with_published_location,
+    django_assert_num_queries,
+):
+    post = post_with_published_location
+    mixer.cycle(3).blend("blog.Comment", post=post)
+    # Пост со связанными объектами и комментарии с авторами.
+    with django_assert_num_queries(2):
+        response = client.get(f"/posts/{post.id}/")
+    assert len(response.context["comments"]) == 3
+
+
+@pytest.mark.django_db
+def test_list_pages_queries(
+    user: Model,
+    client: Client,
+    many_posts_with_published_locations,
+    django_assert_num_queries,
+):
+    category = many_posts_with_published_locations[0].category
+    # Для каждой страницы: агрегаты для ETag или поиск категории/автора,
+    # количество постов, ключи постов страницы и сами посты.
+    for url, n_queries in (
+        ("/", 4),
+        (f"/category/{category.slug}/", 5),
+        (f"/profile/{user.username}/", 4),
+    ):
+        with django_assert_num_queries(n_queries):
+            response = client.get(url)
+        assert len(response.context["page_obj"]) == 10
+
+
+@pytest.mark.django_db
+def test_page_changed_during_render_is_not_cached_as_fresh(rf):
+    rendered = []
+
+    def view(request):
+        rendered.append(request)
+        if len(rendered) == 1:
+            bump_posts_version()
+        return HttpResponse("page")
+
+    cached_view = cache_posts_page(60)(view)
+    cached_view(rf.get("/"))
+    cached_view(rf.get("/"))
+    assert len(rendered) == 2, (
+        "Убедитесь, что страница, данные которой изменились во время"
+        " рендера, не сохраняется в кеш под новой версией постов."
+    )
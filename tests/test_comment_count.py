@@ -0,0 +1,160 @@
+import pytest
+from django.db import connection
+from django.db.models import Model
+from django.test import Client
+from mixer.backend.django import Mixer
+
+from blog import signals
+from blog.models import Comment, Post
+
+
+def comment_count(post: Model) -> int:
+    return Post.objects.values_list(
+        "comment_count", flat=True
+    ).get(pk=post.pk)
+
+
+@pytest.mark.django_db
+def test_comment_count_through_views(
+    user_client: Client, post_with_published_location: Model
+):
+    post = post_with_published_location
+    for text in ("first", "second"):
+        user_client.post(f"/posts/{post.id}/comment/", {"text": text})
+    assert comment_count(post) == 2
+
+    comment = Comment.objects.filter(post=post).first()
+    user_client.post(f"/posts/{post.id}/delete_comment/{comment.id}/")
+    assert comment_count(post) == 1
+
+
+@pytest.mark.django_db
+def test_comment_count_through_orm(
+    mixer: Mixer, post_with_published_location: Model
+):
+    post = post_with_published_location
+    comments = mixer.cycle(3).blend("blog.Comment", post=post)
+    assert comment_count(post) == 3
+
+    comments[0].delete()
+    Comment.objects.filter(pk=comments[1].pk).delete()
+    assert comment_count(post) == 1
+
+
+@pytest.mark.django_db
+def test_comment_count_on_moved_comment(
+    mixer: Mixer, post_with_published_location: Model
+):
+    source = post_with_published_location
+    target = mixer.blend("blog.Post")
+    comment = mixer.blend("blog.Comment", post=source)
+
+    comment.post = target
+    comment.save()
+    assert comment_count(source) == 0
+    assert comment_count(target) == 1
+
+    comment.delete()
+    assert comment_count(target) == 0
+
+
+def drop_comment_count_triggers(*actions: str) -> None:
+    with connection.cursor() as cursor:
+        for action in actions:
+            cursor.execute(
+                f"DROP TRIGGER IF EXISTS blog_comment_count_{action};"
+            )
+    signals.reset_comment_count_triggers(connection.alias)
+
+
+@pytest.fixture
+def reset_trigger_cache():
+    yield
+    signals.reset_comment_count_triggers(connection.alias)
+
+
+@pytest.fixture
+def without_comment_count_triggers(reset_trigger_cache):
+    drop_comment_count_triggers("insert", "update", "delete")
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("without_comment_count_triggers")
+def test_comment_count_fallback_without_triggers(
+    mixer: Mixer, post_with_published_location: Model
+):
+    source = post_with_published_location
+    target = mixer.blend("blog.Post")
+    comments = mixer.cycle(2).blend("blog.Comment", post=source)
+    assert comment_count(source) == 2
+
+    comments[0].post = target
+    comments[0].save()
+    assert comment_count(source) == 1
+    assert comment_count(target) == 1
+
+    comments[0].delete()
+    comments[1].delete()
+    assert comment_count(source) == 0
+    assert comment_count(target) == 0
+
+
+@pytest.mark.django_db
+def test_stale_post_save_keeps_comment_count(
+    mixer: Mixer, post_with_published_location: Model
+):
+    stale_post = Post.objects.get(pk=post_with_published_location.pk)
+    mixer.blend("blog.Comment", post=post_with_published_location)
+    stale_post.title = "edited"
+    stale_post.save()
+    assert comment_count(stale_post) == 1
+
+
+@pytest.mark.django_db
+def test_post_edit_view_keeps_comment_count(
+    user_client: Client, mixer: Mixer, post_with_published_location: Model
+):
+    post = post_with_published_location
+    mixer.blend("blog.Comment", post=post)
+    response = user_client.post(
+        f"/posts/{post.id}/edit/",
+        {
+            "title": "edited",
+            "text": post.text,
+            "pub_date": post.pub_date.strftime("%Y-%m-%dT%H:%M"),
+            "category": post.category_id,
+            "location": post.location_id,
+        },
+    )
+    assert response.status_code == 302
+    assert Post.objects.get(pk=post.pk).title == "edited"
+    assert comment_count(post) == 1
+
+
+@pytest.mark.django_db
+def test_comment_count_triggers_are_detected(reset_trigger_cache):
+    assert signals.get_comment_count_triggers(connection.alias) == set(
+        signals.COMMENT_COUNT_TRIGGERS.values()
+    )
+    drop_comment_count_triggers("update")
+    assert not signals.has_comment_count_trigger("update", connection.alias)
+    assert signals.has_comment_count_trigger("insert", connection.alias)
+
+
+@pytest.mark.django_db
+def test_comment_count_with_missing_update_trigger(
+    mixer: Mixer, post_with_published_location: Model, reset_trigger_cache
+):
+    drop_comment_count_triggers("update")
+    source = post_with_published_location
+    target = mixer.blend("blog.Post")
+    comment = mixer.blend("blog.Comment", post=source)
+    assert comment_count(source) == 1
+
+    comment.post = target
+    comment.save()
+    assert comment_count(source) == 0
+    assert comment_count(target) == 1
+
+    comment.delete()
+    assert comment_count(target) == 0
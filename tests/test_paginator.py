@@ -0,0 +1,72 @@
+import pytest
+from django.db.models import Model
+from django.test import Client
+from mixer.backend.django import Mixer
+
+from blog.models import Post
+from blog.paginators import PostPaginator
+
+
+@pytest.fixture
+def fifteen_posts(mixer: Mixer, user: Model, published_category: Model):
+    return mixer.cycle(15).blend(
+        "blog.Post", author=user, category=published_category
+    )
+
+
+def make_paginator(cache_key: str = "view", **kwargs) -> PostPaginator:
+    return PostPaginator(
+        Post.objects.order_by("-pub_date", "-id"),
+        10,
+        cache_key=cache_key,
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+def test_count_is_reused_for_same_key(
+    fifteen_posts, django_assert_num_queries
+):
+    with django_assert_num_queries(1):
+        assert make_paginator().count == 15
+    with django_assert_num_queries(0):
+        assert make_paginator().count == 15
+    with django_assert_num_queries(1):
+        assert make_paginator(cache_key="another").count == 15
+
+
+@pytest.mark.django_db
+def test_count_is_invalidated_on_post_save_and_delete(
+    mixer: Mixer, fifteen_posts
+):
+    assert make_paginator().count == 15
+    mixer.blend("blog.Post")
+    assert make_paginator().count == 16
+    fifteen_posts[0].delete()
+    assert make_paginator().count == 15
+
+
+@pytest.mark.django_db
+def test_page_returns_rows_in_order(fifteen_posts):
+    expected = list(Post.objects.order_by("-pub_date", "-id"))
+    paginator = make_paginator()
+    assert list(paginator.page(1)) == expected[:10]
+    assert list(paginator.page(2)) == expected[10:]
+
+
+@pytest.mark.django_db
+def test_page_merges_orphans_into_last_page(fifteen_posts):
+    expected = list(Post.objects.order_by("-pub_date", "-id"))
+    paginator = make_paginator(orphans=5)
+    assert paginator.num_pages == 1
+    assert list(paginator.page(1)) == expected
+
+
+@pytest.mark.django_db
+def test_index_last_page(client: Client, fifteen_posts):
+    expected = list(Post.published.order_by("-pub_date", "-id"))
+    first_page = client.get("/").context["page_obj"]
+    last_page = client.get("/?page=2").context["page_obj"]
+    assert list(first_page) == expected[:10]
+    assert list(last_page) == expected[10:]
+    assert len(last_page) == 5
@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_static_pages_as_cbv():
     try:
         from pages import urls
@@ -26,3 +29,15 @@ def test_static_pages_as_cbv():
                 "Убедитесь, что в файле `pages/urls.py` маршруты статических"
                 " страниц подключены с помощью CBV."
             )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ("/pages/about/", "/pages/rules/"))
+def test_static_pages_cache_varies_on_user(user, user_client, client, url):
+    user_content = user_client.get(url).content.decode("utf-8")
+    assert user.username in user_content
+    anonymous_content = client.get(url).content.decode("utf-8")
+    assert user.username not in anonymous_content, (
+        "Убедитесь, что закешированная статическая страница пользователя"
+        " не отдаётся другим посетителям."
+    )